@@ -60,6 +60,16 @@ class EagleDensityFunction(om.ExplicitComponent):
             dx=0, dy=1
         )
 
+        # bounding box of the presence density map, i.e. the spline domain
+        tx, ty, _ = self.eagle_density_function.tck
+        kx, ky = self.eagle_density_function.degrees
+        self._x_min, self._x_max = tx[kx], tx[-kx - 1]
+        self._y_min, self._y_max = ty[ky], ty[-ky - 1]
+
+        # recent evaluations, keyed on the turbine coordinates
+        self._cache = {}
+        self._cache_size = 2  # the current point and a line-search probe
+
         # add the full layout inputs
         self.add_input(
             "x_turbines",
@@ -97,33 +107,108 @@ class EagleDensityFunction(om.ExplicitComponent):
             method="exact",
         )
 
+    def evaluate_density(self, x_turbines, y_turbines):
+        """
+        Evaluate the density function at the turbines.
+
+        Evaluates the presence density spline pointwise with FITPACK. Outside
+        the bounding box of the map, the density is held at its value on the
+        edge of the box.
+
+        Parameters
+        ----------
+        x_turbines : np.ndarray
+            a 1-D numpy array of the x (i.e. Easting) turbine coordinates in
+            meters
+        y_turbines : np.ndarray
+            a 1-D numpy array of the y (i.e. Northing) turbine coordinates in
+            meters
+
+        Returns
+        -------
+        np.ndarray
+            the normalized eagle presence density at each turbine
+        """
+
+        return self.eagle_density_function.ev(x_turbines, y_turbines)
+
+    def evaluate_density_gradient(self, x_turbines, y_turbines):
+        """
+        Evaluate the gradients of the density function at the turbines.
+
+        Evaluates both partial derivatives of the presence density spline
+        pointwise with FITPACK, using the derivative splines built in setup.
+        Along each coordinate clamped to the bounding box of the map, the
+        gradient is zero.
+
+        Parameters
+        ----------
+        x_turbines : np.ndarray
+            a 1-D numpy array of the x (i.e. Easting) turbine coordinates in
+            meters
+        y_turbines : np.ndarray
+            a 1-D numpy array of the y (i.e. Northing) turbine coordinates in
+            meters
+
+        Returns
+        -------
+        np.ndarray
+            the derivative of the density w.r.t. each turbine's x coordinate
+        np.ndarray
+            the derivative of the density w.r.t. each turbine's y coordinate
+        """
+
+        # evaluate the partial derivative splines pointwise
+        dfdx = self.eagle_density_function_dx(x_turbines, y_turbines, grid=False)
+        dfdy = self.eagle_density_function_dy(x_turbines, y_turbines, grid=False)
+
+        # FITPACK holds the density at its edge value outside the box, so it does
+        # not vary along any clamped coordinate
+        dfdx[(x_turbines < self._x_min) | (x_turbines > self._x_max)] = 0.0
+        dfdy[(y_turbines < self._y_min) | (y_turbines > self._y_max)] = 0.0
+
+        return dfdx, dfdy
+
+    def _evaluate_density_cached(self, x_turbines, y_turbines):
+        """
+        Evaluate the density function, reusing recent results for the same
+        turbine coordinates (see `evaluate_density`).
+        """
+
+        key = (x_turbines.tobytes(), y_turbines.tobytes())
+        if key not in self._cache:
+            # evict the oldest entry to keep the cache bounded
+            if len(self._cache) >= self._cache_size:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[key] = self.evaluate_density(x_turbines, y_turbines)
+
+        return self._cache[key]
+
     def compute(self, inputs, outputs):
         """
         Computation for the OM component.
         """
 
-        # unpack the turbine locations
-        x_turbines = inputs["x_turbines"]  # m
-        y_turbines = inputs["y_turbines"]  # m
+        # unpack the turbine locations as contiguous coordinate arrays
+        x_turbines = np.ascontiguousarray(inputs["x_turbines"], dtype=np.float64)  # m
+        y_turbines = np.ascontiguousarray(inputs["y_turbines"], dtype=np.float64)  # m
 
         # evaluate the density function at each turbine point
-        outputs["eagle_normalized_density"] = self.eagle_density_function(
-            x_turbines,
-            y_turbines,
-            grid=False,
-        )
+        f = self._evaluate_density_cached(x_turbines, y_turbines)
+
+        # write straight into the output vector's buffer
+        np.copyto(outputs["eagle_normalized_density"], f)
 
     def compute_partials(self, inputs, partials):
         """
         Compute the partials for the OM component
         """
 
-        # unpack the turbine locations
-        x_turbines = inputs["x_turbines"]  # m
-        y_turbines = inputs["y_turbines"]  # m
+        # unpack the turbine locations as contiguous coordinate arrays
+        x_turbines = np.ascontiguousarray(inputs["x_turbines"], dtype=np.float64)  # m
+        y_turbines = np.ascontiguousarray(inputs["y_turbines"], dtype=np.float64)  # m
 
         # evaluate the gradients for each variable
-        dfdx = self.eagle_density_function_dx(x_turbines, y_turbines, grid=False)
-        dfdy = self.eagle_density_function_dy(x_turbines, y_turbines, grid=False)
+        dfdx, dfdy = self.evaluate_density_gradient(x_turbines, y_turbines)
         partials["eagle_normalized_density", "x_turbines"] = dfdx
         partials["eagle_normalized_density", "y_turbines"] = dfdy
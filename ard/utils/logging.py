@@ -1,13 +1,86 @@
-from contextlib import redirect_stdout, redirect_stderr
 from functools import wraps
 from io import StringIO
 from pathlib import Path
 import shutil
 import sys
+import weakref
 
 import openmdao.core.component
 
 
+class _LazyLogFile:
+    """
+    A log file stand-in that only creates and opens the file on first write.
+
+    On the first write, the log directory is created and the file is opened for
+    line-buffered writing, truncating any log left at the same path by an
+    earlier run. The file then stays open until the stand-in is closed, after
+    which it cannot be written to again. Until the first write, components that
+    print nothing cost no filesystem work at all.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        the path to the log file
+    """
+
+    # the stream properties are fixed, so probing them does not open the file
+    encoding = "utf-8"
+    errors = "strict"
+
+    def __init__(self, path):
+        self.path = path
+        self.closed = False
+        self._file = None
+
+    def _open(self):
+        if self.closed:
+            raise ValueError(f"I/O operation on closed log file {self.path}")
+        if self._file is None:
+            # start a fresh log the first time this file is written to
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(
+                self.path,
+                "w",
+                buffering=1,
+                encoding=self.encoding,
+                errors=self.errors,
+            )
+        return self._file
+
+    def write(self, data):
+        return self._open().write(data)
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def isatty(self):
+        return False
+
+    def writable(self):
+        return True
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+        self.closed = True
+
+    def __getattr__(self, name):
+        # anything else (e.g. fileno) needs the real file, which a closed log or
+        # a special name lookup (e.g. by copy or pickle) must not reopen
+        if self.closed or name.startswith("_"):
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        return getattr(self._open(), name)
+
+
+def _close_logs(*log_files):
+    for log_file in log_files:
+        log_file.close()
+
+
 def extract_iter(component):
     """
     Extract the iter_count iff it exists, otherwise return None
@@ -26,17 +99,56 @@ def extract_iter(component):
         int or None: The iteration count from the model if it exists and is
                     accessible, otherwise None.
             The function returns None in the following cases:
-            - component doesn't have a _problem_meta attribute
+            - component doesn't have a _problem_meta attribute, or it is not
+              set up yet
             - problem_meta doesn't contain a "model_ref" key
             - the model doesn't have an iter_count attribute
     """
 
     # extract the iter count if it exists, returning and handling none otherwise
-    problem_meta = getattr(component, "_problem_meta", None)
-    model = problem_meta.get("model_ref", lambda _: None)()
-    iter_count = getattr(model, "iter_count", None)
+    try:
+        return component._problem_meta["model_ref"]().iter_count
+    except (AttributeError, KeyError, TypeError):
+        return None
 
-    return iter_count
+
+def get_storage_path(
+    component,
+    storage_type: str = "logs",
+    get_iter: bool = False,
+):
+    """
+    Get the path of the storage directory for a component, without creating it.
+
+    Parameters
+    ----------
+    component : openmdao.core.Component
+        an OpenMDAO component for which we want a storage directory
+    storage_type : str, optional
+        the type of storage sub-directory, by default "logs"
+    get_iter : bool, optional
+        should the storage directory tree be given an iteration subdirectory, by
+        default False
+
+    Returns
+    -------
+    pathlib.Path
+        the path to the storage subdirectory
+    """
+    # the storage type we're doing (logs, discipline scripts, etc.)
+    storage_dir = [
+        storage_type,
+    ]
+    # if there's an iteration number to grab, grab it and add it to the dir
+    iter = extract_iter(component) if get_iter else None
+    if iter:
+        storage_dir += [f"iter_{iter:04d}"]
+    # mirror the comp path for a log directory
+    subdir_logger = component.pathname.split(".")
+    # find the reports directory
+    dir_reports = Path(component._problem_meta["reports_dir"])
+    # put the storage directory next to it
+    return Path(dir_reports.parent, *storage_dir, *subdir_logger)
 
 
 def get_storage_directory(
@@ -70,20 +182,7 @@ def get_storage_directory(
     pathlib.Path
         the path to the storage subdirectory created
     """
-    # the storage type we're doing (logs, discipline scripts, etc.)
-    storage_dir = [
-        storage_type,
-    ]
-    # if there's an iteration number to grab, grab it and add it to the dir
-    iter = extract_iter(component) if get_iter else None
-    if iter:
-        storage_dir += [f"iter_{iter:04d}"]
-    # mirror the comp path for a log directory
-    subdir_logger = component.pathname.split(".")
-    # find the reports directory
-    dir_reports = Path(component._problem_meta["reports_dir"])
-    # put the storage directory next to it
-    path_storage = Path(dir_reports.parent, *storage_dir, *subdir_logger)
+    path_storage = get_storage_path(component, storage_type, get_iter)
 
     # make a clean log location for this component if permitted
     try:
@@ -100,12 +199,13 @@ def get_storage_directory(
 
 def name_create_log(component, iter: int = None):
     """
-    For a given component, clean and create component- and rank-unique logfiles.
+    For a given component, name component- and rank-unique logfiles.
 
-    Take a component and create logs, parallel to the reports file, mirroring
+    Take a component and name logs, parallel to the reports file, mirroring
     the OpenMDAO model structure with stdout and stderr files for each rank,
     and finally return the file paths for the component to redirect stdout and
-    stderr to.
+    stderr to. The logs and their directories are not created here, but on the
+    first write by `component_log_capture`.
 
     Parameters
     ----------
@@ -126,15 +226,27 @@ def name_create_log(component, iter: int = None):
             f"Expected openmdao.core.component.Component, got {type(component)}"
         )
 
-    path_logfile_template = (
-        get_storage_directory(component, "logs", True, clean=True)
-        / f"%s_rank{component._comm.rank:03d}.txt"
+    # the log paths only change with the iteration (or a new problem setup), so
+    # reuse the paths built on the last call while they are still current
+    key_paths = (
+        component.pathname,
+        component._problem_meta["reports_dir"],
+        extract_iter(component),
     )
+    cached_paths = getattr(component, "_ard_log_paths", None)
+    if cached_paths is not None and cached_paths[0] == key_paths:
+        return cached_paths[1]
+
+    path_logs = get_storage_path(component, "logs", True)
+    path_logfile_template = path_logs / f"%s_rank{component._comm.rank:03d}.txt"
     path_logfile_stdout = Path(path_logfile_template.as_posix() % "stdout")
     path_logfile_stderr = Path(path_logfile_template.as_posix() % "stderr")
 
-    # return stdout and stderr files
-    return path_logfile_stdout.absolute(), path_logfile_stderr.absolute()
+    # cache and return stdout and stderr files
+    paths = (path_logfile_stdout.absolute(), path_logfile_stderr.absolute())
+    component._ard_log_paths = (key_paths, paths)
+
+    return paths
 
 
 def component_log_capture(compute_func, iter: int = None):
@@ -143,9 +255,14 @@ def component_log_capture(compute_func, iter: int = None):
 
     This decorator will redirect stdout and stderr to component-wise and
     rank-wise logfiles, which are determined by the `name_create_log` function.
-    The decorator uses context managers to redirect output streams to these
-    files, ensuring that all print statements and errors within the function are
-    logged appropriately.
+    The log files are kept on the component between calls, and are only
+    replaced when the log location changes (e.g. on a new iteration) and closed
+    when the component is garbage collected or the interpreter exits, with
+    `sys.stdout` and `sys.stderr` pointed at them for the duration of the call,
+    ensuring that all print statements and errors within the function are
+    logged appropriately. Logs left at a new location by an earlier run are
+    removed, and the files are only created once something is written to them,
+    so functions that print nothing leave no logs behind.
 
     func : Callable
         The function to be decorated. It should be a method of a class, as
@@ -170,17 +287,29 @@ def component_log_capture(compute_func, iter: int = None):
         # get log file paths
         path_stdout_log, path_stderr_log = name_create_log(self)
 
+        # replace the log files only when the log location has changed
+        if getattr(self, "_ard_log_key", None) != path_stdout_log:
+            if getattr(self, "_ard_log_key", None) is not None:
+                self._ard_log_finalizer()
+            # clear out logs an earlier run left here, so that one this run
+            # never writes to is not mistaken for output of this run
+            path_stdout_log.unlink(missing_ok=True)
+            path_stderr_log.unlink(missing_ok=True)
+            self._ard_log_stdout = _LazyLogFile(path_stdout_log)
+            self._ard_log_stderr = _LazyLogFile(path_stderr_log)
+            self._ard_log_key = path_stdout_log
+            # close the last logs when the component goes away (or at exit)
+            self._ard_log_finalizer = weakref.finalize(
+                self, _close_logs, self._ard_log_stdout, self._ard_log_stderr
+            )
+
+        # redirect stdout & stderr, restoring them even if the function raises
+        old_stdout, old_stderr = sys.stdout, sys.stderr
+        sys.stdout, sys.stderr = self._ard_log_stdout, self._ard_log_stderr
         try:
-            # use context manager to redirect stdout & stderr
-            with (
-                open(path_stdout_log, "a") as stdout_file,
-                open(path_stderr_log, "a") as stderr_file,
-                redirect_stdout(stdout_file),
-                redirect_stderr(stderr_file),
-            ):
-                return compute_func(self, *args, **kwargs)
-        except Exception:
-            raise  # make sure the exception is raised
+            return compute_func(self, *args, **kwargs)
+        finally:
+            sys.stdout, sys.stderr = old_stdout, old_stderr
 
     return wrapper
 
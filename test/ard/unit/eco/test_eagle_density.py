@@ -103,3 +103,147 @@ class TestEagleDensityFunction:
                     out_stream=None,
                 )
                 om_utils.assert_check_partials(partials)
+
+    def test_partials_diagonal_storage(self):
+
+        comp = self.prob.model.eagle_density
+        N_turbines = self.modeling_options["layout"]["N_turbines"]
+        self.prob.final_setup()
+
+        # the partials are declared diagonal, so only the diagonal is stored
+        for wrt in ["x_turbines", "y_turbines"]:
+            subjac_info = comp._subjacs_info[
+                f"{comp.pathname}.eagle_normalized_density", f"{comp.pathname}.{wrt}"
+            ]
+            assert subjac_info["diagonal"]
+            assert subjac_info["shape"] == (N_turbines, N_turbines)
+            assert np.shape(subjac_info["val"]) == (N_turbines,)
+
+    def test_evaluate_density_matches_spline(self, subtests):
+
+        comp = self.prob.model.eagle_density
+        N_turbines = self.modeling_options["layout"]["N_turbines"]
+
+        # generated from casting random bytestreams to int
+        seeds = [2005908367, 1273391448, 2557384174, 2195599068, 1604240584]
+
+        for seed in seeds:
+
+            # create a repeatable rng, reaching past the edges of the map
+            rng = np.random.default_rng(seed)
+            x_turbines = rng.uniform(-1200.0, 1200.0, N_turbines)
+            y_turbines = rng.uniform(-1200.0, 1200.0, N_turbines)
+
+            f = comp.evaluate_density(x_turbines, y_turbines)
+            dfdx, dfdy = comp.evaluate_density_gradient(x_turbines, y_turbines)
+
+            # the evaluation should reproduce the FITPACK spline, except
+            # that the density is flat along coordinates clamped to the map
+            spline = comp.eagle_density_function
+            dfdx_spline = spline.ev(x_turbines, y_turbines, dx=1)
+            dfdy_spline = spline.ev(x_turbines, y_turbines, dy=1)
+            dfdx_spline[np.abs(x_turbines) > 1000.0] = 0.0
+            dfdy_spline[np.abs(y_turbines) > 1000.0] = 0.0
+            with subtests.test(f"evaluate_density check seed {seed}"):
+                assert np.allclose(f, spline.ev(x_turbines, y_turbines))
+                assert np.allclose(dfdx, dfdx_spline)
+                assert np.allclose(dfdy, dfdy_spline)
+
+    def test_evaluation_cache(self, monkeypatch):
+
+        comp = self.prob.model.eagle_density
+        N_turbines = self.modeling_options["layout"]["N_turbines"]
+
+        # count the evaluations of the density function
+        evaluations = []
+        evaluate_density = comp.evaluate_density
+
+        def evaluate_density_counted(x_turbines, y_turbines):
+            evaluations.append(x_turbines.copy())
+            return evaluate_density(x_turbines, y_turbines)
+
+        monkeypatch.setattr(comp, "evaluate_density", evaluate_density_counted)
+
+        # create a repeatable rng
+        rng = np.random.default_rng(1273391448)
+        layouts = [
+            (
+                rng.uniform(-1000.0, 1000.0, N_turbines),
+                rng.uniform(-1000.0, 1000.0, N_turbines),
+            )
+            for _ in range(4)
+        ]
+
+        def run_layout(x_turbines, y_turbines):
+            self.prob.set_val("x_turbines", x_turbines, units="m")
+            self.prob.set_val("y_turbines", y_turbines, units="m")
+            self.prob.run_model()
+            return self.prob.get_val("eagle_normalized_density").copy()
+
+        # each new layout is evaluated once
+        densities = [run_layout(*layout) for layout in layouts]
+        assert len(evaluations) == len(layouts)
+
+        # rerunning the two most recent layouts hits the cache
+        assert np.array_equal(run_layout(*layouts[-1]), densities[-1])
+        assert np.array_equal(run_layout(*layouts[-2]), densities[-2])
+        assert len(evaluations) == len(layouts)
+
+        # older layouts have been evicted, so they are evaluated again
+        assert np.array_equal(run_layout(*layouts[0]), densities[0])
+        assert len(evaluations) == len(layouts) + 1
+        assert len(comp._cache) <= comp._cache_size
+
+    def test_gradient_evaluated_lazily(self, monkeypatch):
+
+        comp = self.prob.model.eagle_density
+        N_turbines = self.modeling_options["layout"]["N_turbines"]
+
+        # count the gradient evaluations of the density function
+        evaluations = []
+        evaluate_density_gradient = comp.evaluate_density_gradient
+
+        def evaluate_density_gradient_counted(x_turbines, y_turbines):
+            evaluations.append(x_turbines.copy())
+            return evaluate_density_gradient(x_turbines, y_turbines)
+
+        monkeypatch.setattr(
+            comp, "evaluate_density_gradient", evaluate_density_gradient_counted
+        )
+
+        # create a repeatable rng
+        rng = np.random.default_rng(2557384174)
+        self.prob.set_val("x_turbines", rng.uniform(-1000.0, 1000.0, N_turbines))
+        self.prob.set_val("y_turbines", rng.uniform(-1000.0, 1000.0, N_turbines))
+
+        # the forward pass leaves the gradients to compute_partials
+        self.prob.run_model()
+        assert len(evaluations) == 0
+        self.prob.compute_totals(
+            "eagle_normalized_density", ["x_turbines", "y_turbines"]
+        )
+        assert len(evaluations) == 1
+
+    def test_gradient_eagle_density_outside_map(self):
+
+        N_turbines = self.modeling_options["layout"]["N_turbines"]
+
+        # create a repeatable rng, placing turbines past the edges of the map
+        rng = np.random.default_rng(2195599068)
+        x_turbines = rng.uniform(-1000.0, 1000.0, N_turbines)
+        y_turbines = rng.uniform(-1000.0, 1000.0, N_turbines)
+        x_turbines[::2] += np.sign(x_turbines[::2]) * 1500.0
+        y_turbines[::3] += np.sign(y_turbines[::3]) * 1500.0
+
+        # set up the model to run
+        self.prob.set_val("x_turbines", x_turbines, units="m")
+        self.prob.set_val("y_turbines", y_turbines, units="m")
+        self.prob.run_model()
+
+        # the partials should match the clamped density
+        partials = self.prob.check_partials(
+            method="fd",
+            step=1.0e-8,
+            out_stream=None,
+        )
+        om_utils.assert_check_partials(partials)
@@ -0,0 +1,199 @@
+import gc
+import sys
+
+import openmdao.api as om
+
+import ard.utils.logging
+
+import pytest
+
+
+class PrintingComponent(om.ExplicitComponent):
+    """A minimal component that writes to stdout and stderr for positive x."""
+
+    def setup(self):
+        self.modeling_options = {"stdio_capture": True}
+        self.add_input("x", 1.0)
+        self.add_output("y", 1.0)
+
+    @ard.utils.logging.component_log_capture
+    def compute(self, inputs, outputs):
+        if inputs["x"][0] > 0.0:
+            print(f"stdout x: {inputs['x'][0]}")
+            print(f"stderr x: {inputs['x'][0]}", file=sys.stderr)
+        outputs["y"] = 2.0 * inputs["x"]
+
+
+class TestLazyLogFile:
+
+    def test_stream_properties(self, tmp_path):
+
+        # probing the stream properties doesn't create the log
+        log_file = ard.utils.logging._LazyLogFile(tmp_path / "logs" / "stdout.txt")
+        assert log_file.encoding == "utf-8"
+        assert log_file.errors == "strict"
+        assert log_file.writable()
+        assert not log_file.isatty()
+        assert not log_file.path.exists()
+
+    def test_closed(self, tmp_path):
+
+        # a closed log has no file to delegate to
+        log_file = ard.utils.logging._LazyLogFile(tmp_path / "logs" / "stdout.txt")
+        log_file.close()
+        assert not hasattr(log_file, "fileno")
+        with pytest.raises(ValueError):
+            log_file.write("late output\n")
+        assert not log_file.path.exists()
+
+
+class TestExtractIter:
+
+    def test_extract_iter(self, tmp_path, monkeypatch):
+
+        # keep the problem outputs in a scratch directory
+        monkeypatch.chdir(tmp_path)
+
+        prob = om.Problem(name="logging")
+        printer = prob.model.add_subsystem("printer", PrintingComponent())
+
+        # no problem metadata before setup
+        assert ard.utils.logging.extract_iter(printer) is None
+        assert ard.utils.logging.extract_iter(object()) is None
+
+        # after setup, the model's iteration count is available
+        prob.setup()
+        assert ard.utils.logging.extract_iter(printer) == 0
+
+
+class TestComponentLogCapture:
+
+    @pytest.fixture(autouse=True)
+    def setup_problem(self, tmp_path, monkeypatch):
+
+        # keep the problem outputs and logs in a scratch directory
+        monkeypatch.chdir(tmp_path)
+        self.path_logs = tmp_path / "logging_out" / "logs"
+
+        self.prob = om.Problem(name="logging")
+        self.prob.model.add_subsystem("printer", PrintingComponent())
+        self.prob.setup()
+
+    def test_capture(self, capsys):
+
+        self.prob.run_model()
+
+        # the output goes to the logs, not the console
+        captured = capsys.readouterr()
+        assert "stdout x" not in captured.out
+        assert "stderr x" not in captured.err
+
+        (path_stdout,) = self.path_logs.rglob("stdout_rank000.txt")
+        (path_stderr,) = self.path_logs.rglob("stderr_rank000.txt")
+        assert path_stdout.read_text() == "stdout x: 1.0\n"
+        assert path_stderr.read_text() == "stderr x: 1.0\n"
+
+    def test_capture_repeated_compute(self):
+
+        # repeated calls within an iteration append to the same logs
+        for x in [1.0, 2.0, 3.0]:
+            self.prob.set_val("printer.x", x)
+            self.prob.run_model()
+
+        (path_stdout,) = self.path_logs.rglob("stdout_rank000.txt")
+        assert path_stdout.read_text().splitlines() == [
+            f"stdout x: {x}" for x in [1.0, 2.0, 3.0]
+        ]
+
+    def test_capture_new_iteration(self):
+
+        # the first call lands in the un-numbered iteration, the next in a new one
+        self.prob.run_model()
+        log_stdout_first = self.prob.model.printer._ard_log_stdout
+        self.prob.set_val("printer.x", 2.0)
+        self.prob.model.run_solve_nonlinear()
+
+        # the logs of the previous iteration are closed and left intact
+        assert log_stdout_first.closed
+        assert (self.path_logs / "printer" / "stdout_rank000.txt").read_text() == (
+            "stdout x: 1.0\n"
+        )
+        assert (
+            self.path_logs / "iter_0001" / "printer" / "stdout_rank000.txt"
+        ).read_text() == "stdout x: 2.0\n"
+
+    def test_capture_closed_on_teardown(self):
+
+        # the logs of the last iteration are closed once the problem is gone
+        self.prob.run_model()
+        log_stdout = self.prob.model.printer._ard_log_stdout
+        log_stderr = self.prob.model.printer._ard_log_stderr
+        assert not log_stdout.closed and not log_stderr.closed
+        self.prob = None
+        gc.collect()
+
+        assert log_stdout.closed and log_stderr.closed
+
+    def test_capture_truncates_stale_log(self):
+
+        # a log left behind by an earlier session is started afresh
+        path_stdout = self.path_logs / "printer" / "stdout_rank000.txt"
+        path_stdout.parent.mkdir(parents=True)
+        path_stdout.write_text("stale output\n")
+        self.prob.run_model()
+
+        assert path_stdout.read_text() == "stdout x: 1.0\n"
+
+    def test_capture_new_problem_same_name(self):
+
+        # a new problem with the same name starts the logs afresh
+        self.prob.run_model()
+        prob_new = om.Problem(name="logging")
+        prob_new.model.add_subsystem("printer", PrintingComponent())
+        prob_new.setup()
+        prob_new.set_val("printer.x", 2.0)
+        prob_new.run_model()
+
+        (path_stdout,) = self.path_logs.rglob("stdout_rank000.txt")
+        assert path_stdout.read_text() == "stdout x: 2.0\n"
+
+    def test_capture_removes_stale_logs(self):
+
+        # logs of an earlier run are not left next to those of a new one
+        self.prob.run_model()
+        prob_new = om.Problem(name="logging")
+        prob_new.model.add_subsystem("printer", PrintingComponent())
+        prob_new.setup()
+        prob_new.set_val("printer.x", -1.0)
+        prob_new.run_model()
+
+        assert not list(self.path_logs.rglob("stdout_rank000.txt"))
+        assert not list(self.path_logs.rglob("stderr_rank000.txt"))
+
+    def test_capture_silent(self):
+
+        # nothing is printed, so no logs should be created
+        self.prob.set_val("printer.x", -1.0)
+        self.prob.run_model()
+
+        assert not self.path_logs.exists()
+
+    def test_name_create_log_cached(self):
+
+        printer = self.prob.model.printer
+        self.prob.final_setup()
+
+        # repeated calls in an iteration reuse the paths, a new iteration doesn't
+        paths_first = ard.utils.logging.name_create_log(printer)
+        assert ard.utils.logging.name_create_log(printer) is paths_first
+        self.prob.model.run_solve_nonlinear()
+        paths_next = ard.utils.logging.name_create_log(printer)
+        assert paths_next != paths_first
+        assert paths_next[0] == (
+            self.path_logs / "iter_0001" / "printer" / "stdout_rank000.txt"
+        )
+
+    def test_name_create_log_non_component(self):
+
+        with pytest.raises(TypeError):
+            ard.utils.logging.name_create_log(object())